@@ -25,8 +25,23 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import functools
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Sequence, Tuple
+
+try:
+    import yaml  # type: ignore
+except ImportError as exc:  # pragma: no cover
+    raise SystemExit(
+        "PyYAML is required. Install with: pip install -r tools/color_rules/requirements.txt"
+    ) from exc
+
+# Prefer the libyaml-backed loader; it parses bytes directly and is much faster.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 DEFAULT_TEMPLATES: Dict[str, str] = {
@@ -110,17 +125,83 @@ DEFAULT_TEMPLATES: Dict[str, str] = {
 """,
 }
 
+# Shared fallback for `mapping.get(key) or _EMPTY` lookups. Never mutate it.
+_EMPTY: Dict[str, Any] = {}
+
+_DEFAULT_SEVERITY_LABELS_IT: Tuple[Tuple[str, str], ...] = (
+    ("critical", "Situazione critica!"),
+    ("high", "Richiede attenzione"),
+    ("medium", "Errori moderati"),
+    ("low", "Errori minimi"),
+)
+
+# Error cards in the report (dimension key, card label, fallback subtitle), in display order.
+_ORDERED_CARDS: Tuple[Tuple[str, str, str], ...] = (
+    ("completeness", "COMPLETENESS", "Dimensione più problematica"),
+    ("accuracy", "ACCURACY", "Seconda dimensione critica"),
+    ("consistency", "CONSISTENCY", "Terza dimensione critica"),
+)
+
+_SENTINEL_RE = re.compile(r"@@([A-Z_]+)@@")
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_template(
+    template: str, constants: Tuple[Tuple[str, str], ...] = ()
+) -> Callable[[Mapping[str, Any]], str]:
+    # Lex the @@TOKEN@@ sentinels once; rendering is then a straight join over the
+    # literal segments. Unknown tokens are emitted back unchanged.
+    # Tokens listed in `constants` (values shared by every block of a config, such as the
+    # thresholds) are folded into the literals, so the result is specialized for that config
+    # and only the per-block tokens are filled at render time.
+    folded = dict(constants)
+    parts = _SENTINEL_RE.split(template)
+    head = parts[0]
+    segments: list[Tuple[str, str, str]] = []
+    for token, literal in zip(parts[1::2], parts[2::2]):
+        if token not in folded:
+            segments.append((token, f"@@{token}@@", literal))
+        elif segments:
+            prev_token, prev_sentinel, prev_literal = segments[-1]
+            segments[-1] = (prev_token, prev_sentinel, prev_literal + folded[token] + literal)
+        else:
+            head += folded[token] + literal
+
+    def render(values: Mapping[str, Any]) -> str:
+        out = [head]
+        for token, sentinel, literal in segments:
+            out.append(str(values[token]) if token in values else sentinel)
+            out.append(literal)
+        return "".join(out)
+
+    return render
+
+
+def _freeze(values: Mapping[str, Any]) -> Tuple[Tuple[str, str], ...]:
+    return tuple((token, str(value)) for token, value in values.items())
+
+
+@functools.lru_cache(maxsize=256)
+def _render_cached(
+    template: str, constants: Tuple[Tuple[str, str], ...], replacements: Tuple[Tuple[str, str], ...]
+) -> str:
+    return _compile_template(template, constants)(dict(replacements))
+
+
+def _render(template: str, replacements: Mapping[str, Any], *, constants: Mapping[str, Any] = _EMPTY) -> str:
+    # Rendering is a pure function of the template and the token values, so repeated
+    # renders (same dimension config, same thresholds) are served from the cache.
+    return _render_cached(template, _freeze(constants), _freeze(replacements))
 
-def _load_yaml(path: Path) -> Dict[str, Any]:
-    try:
-        import yaml  # type: ignore
-    except Exception as exc:  # pragma: no cover
-        raise SystemExit(
-            "PyYAML is required. Install with: pip install -r tools/color_rules/requirements.txt"
-        ) from exc
 
-    with path.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+def _load_yaml(path: Path) -> Dict[str, Any]:
+    # The binary stream goes straight to the parser, which detects the encoding (and any
+    # BOM) itself, so decoding problems surface as YAMLError too.
+    with path.open("rb") as f:
+        try:
+            data = yaml.load(f, Loader=_YAML_LOADER)
+        except yaml.YAMLError as exc:
+            raise SystemExit(f"Invalid YAML in {path}: {exc}") from exc
     if not isinstance(data, dict):
         raise SystemExit("Invalid YAML: expected top-level mapping")
     return data
@@ -133,6 +214,8 @@ def _is_complete_schema(raw: Dict[str, Any]) -> bool:
 
 
 def _as_float(value: Any, *, path: str) -> float:
+    if type(value) is float:
+        return value
     try:
         return float(value)
     except Exception as exc:
@@ -140,79 +223,81 @@ def _as_float(value: Any, *, path: str) -> float:
 
 
 def _as_int(value: Any, *, path: str) -> int:
+    if type(value) is int:
+        return value
     try:
         return int(value)
     except Exception as exc:
         raise SystemExit(f"Invalid integer value at {path}: {value!r}") from exc
 
 
-def _normalize_complete(raw: Dict[str, Any]) -> Dict[str, Any]:
-    dim_raw = raw.get("dimension_scores") or {}
-    dim_thresholds_raw = dim_raw.get("thresholds") or {}
+def _clean_label_it(value: Any) -> str:
+    s = (value or "").strip()
+    # COMPLETE labels are like "Completezza (Completeness)"; legacy template already appends (English).
+    if s.endswith(")") and "(" in s:
+        head, _, _ = s.rpartition("(")
+        return head.strip()
+    return s
+
 
-    excellent_value = _as_float((dim_thresholds_raw.get("excellent") or {}).get("value"), path="dimension_scores.thresholds.excellent.value")
-    acceptable_value = _as_float((dim_thresholds_raw.get("acceptable") or {}).get("value"), path="dimension_scores.thresholds.acceptable.value")
+def _normalize_complete(raw: Dict[str, Any]) -> Dict[str, Any]:
+    # Labels are interned so the (possibly cached) normalized config holds one object per distinct label.
+    dim_raw = raw.get("dimension_scores") or _EMPTY
+    dim_thresholds_raw = dim_raw.get("thresholds") or _EMPTY
 
-    def _clean_label_it(value: Any) -> str:
-        s = (value or "").strip()
-        # COMPLETE labels are like "Completezza (Completeness)"; legacy template already appends (English).
-        if "(" in s and s.endswith(")"):
-            return s.split("(", 1)[0].strip()
-        return s
+    excellent_value = _as_float((dim_thresholds_raw.get("excellent") or _EMPTY).get("value"), path="dimension_scores.thresholds.excellent.value")
+    acceptable_value = _as_float((dim_thresholds_raw.get("acceptable") or _EMPTY).get("value"), path="dimension_scores.thresholds.acceptable.value")
 
     dimensions_out: Dict[str, Any] = {}
-    for key, d in (dim_raw.get("dimensions") or {}).items():
+    for key, d in (dim_raw.get("dimensions") or _EMPTY).items():
         if not isinstance(d, dict):
             continue
         dimensions_out[key] = {
             "variable": d.get("variable_score") or d.get("variable") or d.get("id") or "",
             "error_variable": d.get("variable_error") or d.get("error_variable") or "",
-            "label_it": _clean_label_it(d.get("label_it")),
-            "label_en": (d.get("label_en") or ""),
+            "label_it": sys.intern(_clean_label_it(d.get("label_it"))),
+            "label_en": sys.intern(str(d.get("label_en") or "")),
             "description_it": d.get("description_it") or "",
             "error_label_it": "ERRORI",
         }
 
-    err_raw = raw.get("error_distribution") or {}
-    err_thresholds_raw = err_raw.get("thresholds") or {}
+    err_raw = raw.get("error_distribution") or _EMPTY
+    err_thresholds_raw = err_raw.get("thresholds") or _EMPTY
 
     def _mk_min_count(threshold_value: Any, *, path: str) -> int:
         # COMPLETE schema expresses rules as "> value". Legacy schema expects min_count (value+1).
         return _as_int(threshold_value, path=path) + 1
 
-    critical_value = (err_thresholds_raw.get("critical") or {}).get("value")
-    high_value = (err_thresholds_raw.get("high") or {}).get("value")
-    medium_value = (err_thresholds_raw.get("medium") or {}).get("value")
+    crit = err_thresholds_raw.get("critical") or _EMPTY
+    high = err_thresholds_raw.get("high") or _EMPTY
+    medium = err_thresholds_raw.get("medium") or _EMPTY
+    low = err_thresholds_raw.get("low") or _EMPTY
 
     thresholds_out = {
         "critical": {
-            "min_count": _mk_min_count(critical_value, path="error_distribution.thresholds.critical.value"),
-            "label_it": (err_thresholds_raw.get("critical") or {}).get("label_it", "Situazione critica!"),
+            "min_count": _mk_min_count(crit.get("value"), path="error_distribution.thresholds.critical.value"),
+            "label_it": sys.intern(str(crit.get("label_it", "Situazione critica!"))),
         },
         "high": {
-            "min_count": _mk_min_count(high_value, path="error_distribution.thresholds.high.value"),
-            "label_it": (err_thresholds_raw.get("high") or {}).get("label_it", "Richiede attenzione"),
+            "min_count": _mk_min_count(high.get("value"), path="error_distribution.thresholds.high.value"),
+            "label_it": sys.intern(str(high.get("label_it", "Richiede attenzione"))),
         },
         "medium": {
-            "min_count": _mk_min_count(medium_value, path="error_distribution.thresholds.medium.value"),
-            "label_it": (err_thresholds_raw.get("medium") or {}).get("label_it", "Errori moderati"),
+            "min_count": _mk_min_count(medium.get("value"), path="error_distribution.thresholds.medium.value"),
+            "label_it": sys.intern(str(medium.get("label_it", "Errori moderati"))),
         },
         "low": {
-            "max_count": _as_int((err_thresholds_raw.get("low") or {}).get("threshold_value", 10), path="error_distribution.thresholds.low.threshold_value"),
-            "label_it": (err_thresholds_raw.get("low") or {}).get("label_it", "Errori minimi"),
+            "max_count": _as_int(low.get("threshold_value", 10), path="error_distribution.thresholds.low.threshold_value"),
+            "label_it": sys.intern(str(low.get("label_it", "Errori minimi"))),
         },
     }
 
     # Error cards in the report are the top-3 dimensions (historically: completeness, accuracy, consistency).
-    dim_defs = dim_raw.get("dimensions") or {}
+    dim_defs = dim_raw.get("dimensions") or _EMPTY
+    dim_defs_get = dim_defs.get
     error_cards: Dict[str, Any] = {}
-    ordered = [
-        ("completeness", "COMPLETENESS", "Dimensione più problematica"),
-        ("accuracy", "ACCURACY", "Seconda dimensione critica"),
-        ("consistency", "CONSISTENCY", "Terza dimensione critica"),
-    ]
-    for key, label, subtitle in ordered:
-        d = dim_defs.get(key) or {}
+    for key, label, subtitle in _ORDERED_CARDS:
+        d = dim_defs_get(key) or _EMPTY
         if not isinstance(d, dict):
             continue
         var_cnt = d.get("variable_count")
@@ -247,7 +332,7 @@ def _normalize_config(raw: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
 
     # Legacy schema: keep as-is, but ensure templates exist.
     legacy = dict(raw)
-    templates = legacy.get("templates") or {}
+    templates = legacy.get("templates") or _EMPTY
     if not isinstance(templates, dict):
         templates = {}
     if "dimension_score_html" not in templates or "error_distribution_card_html" not in templates:
@@ -257,16 +342,31 @@ def _normalize_config(raw: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
     return legacy, "legacy"
 
 
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> Tuple[Dict[str, Any], str]:
+    # mtime/size only take part in the cache key, so an edited file is reloaded.
+    return _normalize_config(_load_yaml(Path(path)))
+
+
+def _load_config(path: Path, *, use_cache: bool = True) -> Tuple[Dict[str, Any], str]:
+    # Cached configs are shared between callers: treat the result as read-only.
+    if not use_cache:
+        return _normalize_config(_load_yaml(path))
+    st = path.stat()
+    return _load_config_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
 def validate_rules(cfg: Dict[str, Any]) -> None:
     # Dimension score thresholds sanity
-    dim = cfg.get("dimension_scores") or {}
-    thresholds = (dim.get("thresholds") or {})
+    dim = cfg.get("dimension_scores") or _EMPTY
+    thresholds = dim.get("thresholds") or _EMPTY
 
-    excellent = thresholds.get("excellent") or {}
-    acceptable = thresholds.get("acceptable") or {}
+    excellent = thresholds.get("excellent") or _EMPTY
+    acceptable = thresholds.get("acceptable") or _EMPTY
 
-    excellent_pct = float(excellent.get("percentage"))
-    acceptable_min = float(acceptable.get("min_percentage"))
+    # Normalized COMPLETE configs already carry typed numbers; legacy ones are coerced here.
+    excellent_pct = _as_float(excellent.get("percentage"), path="dimension_scores.thresholds.excellent.percentage")
+    acceptable_min = _as_float(acceptable.get("min_percentage"), path="dimension_scores.thresholds.acceptable.min_percentage")
 
     if excellent_pct <= acceptable_min:
         raise SystemExit(
@@ -274,12 +374,12 @@ def validate_rules(cfg: Dict[str, Any]) -> None:
         )
 
     # Error distribution threshold ordering
-    err = cfg.get("error_distribution") or {}
-    t = err.get("thresholds") or {}
+    err = cfg.get("error_distribution") or _EMPTY
+    t = err.get("thresholds") or _EMPTY
 
-    critical_min = int((t.get("critical") or {}).get("min_count"))
-    high_min = int((t.get("high") or {}).get("min_count"))
-    medium_min = int((t.get("medium") or {}).get("min_count"))
+    critical_min = _as_int((t.get("critical") or _EMPTY).get("min_count"), path="error_distribution.thresholds.critical.min_count")
+    high_min = _as_int((t.get("high") or _EMPTY).get("min_count"), path="error_distribution.thresholds.high.min_count")
+    medium_min = _as_int((t.get("medium") or _EMPTY).get("min_count"), path="error_distribution.thresholds.medium.min_count")
 
     if not (critical_min > high_min > medium_min > 0):
         raise SystemExit(
@@ -294,72 +394,119 @@ def _render_dimension_block(template: str, *, dim_cfg: Dict[str, Any], threshold
     acceptable_min = thresholds["acceptable"]["min_percentage"]
 
     replacements = {
-        "@@DIMENSION_NAME@@": dim_cfg.get("label_en", ""),
-        "@@LABEL_IT@@": dim_cfg.get("label_it", ""),
-        "@@LABEL_EN@@": dim_cfg.get("label_en", ""),
-        "@@DESCRIPTION_IT@@": dim_cfg.get("description_it", ""),
-        "@@ERROR_LABEL_IT@@": dim_cfg.get("error_label_it", "ERRORI"),
-        "@@VAR@@": dim_cfg["variable"],
-        "@@ERROR_VAR@@": dim_cfg["error_variable"],
-        "@@THRESH_EXCELLENT@@": str(exc),
-        "@@THRESH_ACCEPTABLE@@": str(acceptable_min),
+        "DIMENSION_NAME": dim_cfg.get("label_en", ""),
+        "LABEL_IT": dim_cfg.get("label_it", ""),
+        "LABEL_EN": dim_cfg.get("label_en", ""),
+        "DESCRIPTION_IT": dim_cfg.get("description_it", ""),
+        "ERROR_LABEL_IT": dim_cfg.get("error_label_it", "ERRORI"),
+        "VAR": dim_cfg["variable"],
+        "ERROR_VAR": dim_cfg["error_variable"],
+    }
+    constants = {
+        "THRESH_EXCELLENT": exc,
+        "THRESH_ACCEPTABLE": acceptable_min,
     }
 
-    out = template
-    for token, value in replacements.items():
-        out = out.replace(token, str(value))
-    return out
-
+    return _render(template, replacements, constants=constants)
 
-def _render_error_card(template: str, *, card_cfg: Dict[str, Any], thresholds: Dict[str, Any]) -> str:
-    # Template expects "threshold_critical" etc as the comparison constants in the ternary.
-    # Thymeleaf uses strict ">" comparisons in the current template.
-    critical_cmp = int(thresholds["critical"]["min_count"]) - 1
-    high_cmp = int(thresholds["high"]["min_count"]) - 1
-    medium_cmp = int(thresholds["medium"]["min_count"]) - 1
 
-    labels = cfg["error_distribution"]["thresholds"]
+def _render_error_card(
+    template: str,
+    *,
+    card_cfg: Dict[str, Any],
+    labels: Dict[str, str],
+    cmp_strs: Tuple[str, str, str],
+) -> str:
+    critical_cmp, high_cmp, medium_cmp = cmp_strs
     replacements = {
-        "@@DIMENSION_NAME@@": card_cfg.get("label", ""),
-        "@@DIMENSION_LABEL@@": card_cfg.get("label", ""),
-        "@@SUBTITLE_FALLBACK_IT@@": card_cfg.get("subtitle_fallback_it", ""),
-        "@@ERROR_VAR@@": card_cfg["variable"],
-        "@@THRESH_CRITICAL@@": str(critical_cmp),
-        "@@THRESH_HIGH@@": str(high_cmp),
-        "@@THRESH_MEDIUM@@": str(medium_cmp),
-        "@@LABEL_CRITICAL_IT@@": str((labels.get("critical") or {}).get("label_it", "Situazione critica!")),
-        "@@LABEL_HIGH_IT@@": str((labels.get("high") or {}).get("label_it", "Richiede attenzione")),
-        "@@LABEL_MEDIUM_IT@@": str((labels.get("medium") or {}).get("label_it", "Errori moderati")),
-        "@@LABEL_LOW_IT@@": str((labels.get("low") or {}).get("label_it", "Errori minimi")),
+        "DIMENSION_NAME": card_cfg.get("label", ""),
+        "DIMENSION_LABEL": card_cfg.get("label", ""),
+        "SUBTITLE_FALLBACK_IT": card_cfg.get("subtitle_fallback_it", ""),
+        "ERROR_VAR": card_cfg["variable"],
+    }
+    constants = {
+        "THRESH_CRITICAL": critical_cmp,
+        "THRESH_HIGH": high_cmp,
+        "THRESH_MEDIUM": medium_cmp,
+        "LABEL_CRITICAL_IT": labels["critical"],
+        "LABEL_HIGH_IT": labels["high"],
+        "LABEL_MEDIUM_IT": labels["medium"],
+        "LABEL_LOW_IT": labels["low"],
     }
 
-    out = template
-    for token, value in replacements.items():
-        out = out.replace(token, str(value))
-    return out
-
-
-def _render_thymeleaf_fragments(*, dimension_blocks: list[str], error_cards: list[str]) -> str:
+    return _render(template, replacements, constants=constants)
+
+
+# Below this many items the pool start-up costs more than sequential rendering.
+_PARALLEL_MIN_ITEMS = 4
+
+
+def _render_all(render: Callable[[Dict[str, Any]], str], items: list[Dict[str, Any]]) -> list[str]:
+    # Renders are pure, so they can run concurrently; map() keeps the input order.
+    if len(items) < _PARALLEL_MIN_ITEMS:
+        # The item count is known up front, so fill a preallocated list by index.
+        out = [""] * len(items)
+        for i, item in enumerate(items):
+            out[i] = render(item)
+        return out
+    with ThreadPoolExecutor() as ex:
+        return list(ex.map(render, items))
+
+
+def _iter_section(parts: Sequence[str]) -> Iterator[str]:
+    # Streams the same text as "\n\n".join(parts).strip() + "\n" without building it.
+    lo, hi = 0, len(parts)
+    while lo < hi and not parts[lo].strip():
+        lo += 1
+    while hi > lo and not parts[hi - 1].strip():
+        hi -= 1
+    if hi - lo == 1:
+        yield parts[lo].strip()
+    elif hi - lo > 1:
+        yield parts[lo].lstrip()
+        for part in parts[lo + 1 : hi - 1]:
+            yield "\n\n"
+            yield part
+        yield "\n\n"
+        yield parts[hi - 1].rstrip()
+    yield "\n"
+
+
+def _iter_thymeleaf_fragments(*, dimension_blocks: list[str], error_cards: list[str]) -> Iterator[str]:
     # Keep this file minimal and includeable.
-    return (
+    yield (
         "<!DOCTYPE html>\n"
         "<html xmlns:th=\"http://www.thymeleaf.org\">\n"
         "  <body>\n"
         "    <th:block th:fragment=\"dimensionScores\">\n"
-        f"{('\n\n'.join(dimension_blocks)).strip()}\n"
+    )
+    yield from _iter_section(dimension_blocks)
+    yield (
         "    </th:block>\n\n"
         "    <th:block th:fragment=\"errorDistributionCards\">\n"
-        f"{('\n\n'.join(error_cards)).strip()}\n"
+    )
+    yield from _iter_section(error_cards)
+    yield (
         "    </th:block>\n"
         "  </body>\n"
         "</html>\n"
     )
 
 
+def _write_atomic(path: Path, chunks: Iterable[str]) -> None:
+    # Stream the chunks into a sibling temp file and rename it over the target, so a failed
+    # run never leaves a half-written snippet behind. No newline translation: the generated
+    # files keep LF endings on every platform.
+    tmp = path.with_name(f".{path.name}.tmp")
+    with tmp.open("w", encoding="utf-8", newline="\n", buffering=1 << 16) as fh:
+        fh.writelines(chunks)
+    os.replace(tmp, path)
+
+
 def generate_snippets(cfg: Dict[str, Any], out_dir: Path, *, fragments_path: Path | None = None) -> None:
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    templates = cfg.get("templates") or {}
+    templates = cfg.get("templates") or _EMPTY
     dim_tpl = templates.get("dimension_score_html")
     err_tpl = templates.get("error_distribution_card_html")
 
@@ -370,32 +517,39 @@ def generate_snippets(cfg: Dict[str, Any], out_dir: Path, *, fragments_path: Pat
     thresholds = dim["thresholds"]
 
     # Dimension score blocks
-    blocks: list[str] = []
-    for _, dim_cfg in (dim.get("dimensions") or {}).items():
-        blocks.append(_render_dimension_block(dim_tpl, dim_cfg=dim_cfg, thresholds=thresholds))
-
-    (out_dir / "dimension-scores-section.snippet.html").write_text(
-        "\n\n".join(blocks).strip() + "\n", encoding="utf-8"
+    blocks = _render_all(
+        lambda dim_cfg: _render_dimension_block(dim_tpl, dim_cfg=dim_cfg, thresholds=thresholds),
+        list((dim.get("dimensions") or _EMPTY).values()),
     )
 
+    _write_atomic(out_dir / "dimension-scores-section.snippet.html", _iter_section(blocks))
+
     # Error distribution cards
     err = cfg["error_distribution"]
     err_thresholds = err["thresholds"]
 
-    cards: list[str] = []
-    for _, card_cfg in (err.get("dimensions") or {}).items():
-        cards.append(_render_error_card(err_tpl, card_cfg=card_cfg, thresholds=err_thresholds))
+    # Same for every card, so resolve once. The template expects the comparison constants
+    # for its ternary; Thymeleaf uses strict ">" comparisons, hence min_count - 1.
+    label_map = {
+        key: str((err_thresholds.get(key) or _EMPTY).get("label_it", default))
+        for key, default in _DEFAULT_SEVERITY_LABELS_IT
+    }
+    cmp_strs = (
+        str(int(err_thresholds["critical"]["min_count"]) - 1),
+        str(int(err_thresholds["high"]["min_count"]) - 1),
+        str(int(err_thresholds["medium"]["min_count"]) - 1),
+    )
 
-    (out_dir / "error-distribution-section.snippet.html").write_text(
-        "\n\n".join(cards).strip() + "\n", encoding="utf-8"
+    cards = _render_all(
+        lambda card_cfg: _render_error_card(err_tpl, card_cfg=card_cfg, labels=label_map, cmp_strs=cmp_strs),
+        list((err.get("dimensions") or _EMPTY).values()),
     )
 
+    _write_atomic(out_dir / "error-distribution-section.snippet.html", _iter_section(cards))
+
     if fragments_path is not None:
         fragments_path.parent.mkdir(parents=True, exist_ok=True)
-        fragments_path.write_text(
-            _render_thymeleaf_fragments(dimension_blocks=blocks, error_cards=cards),
-            encoding="utf-8",
-        )
+        _write_atomic(fragments_path, _iter_thymeleaf_fragments(dimension_blocks=blocks, error_cards=cards))
         print(f"Wrote Thymeleaf fragments to: {fragments_path}")
 
     print(f"Wrote snippets to: {out_dir}")
@@ -407,10 +561,17 @@ def main() -> None:
 
     p_val = sub.add_parser("validate")
     p_val.add_argument("--config", required=True)
+    p_val.add_argument("--no-cache", action="store_true", help="Always re-read and re-normalize the config")
 
     p_gen = sub.add_parser("generate")
     p_gen.add_argument("--config", required=True)
     p_gen.add_argument("--out", required=True)
+    p_gen.add_argument("--no-cache", action="store_true", help="Always re-read and re-normalize the config")
+    p_gen.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Skip threshold validation for COMPLETE configs (legacy configs are always validated)",
+    )
     p_gen.add_argument(
         "--write-fragments",
         required=False,
@@ -423,9 +584,7 @@ def main() -> None:
     if not config_path.exists():
         raise SystemExit(f"Config not found: {config_path}")
 
-    global cfg
-    raw = _load_yaml(config_path)
-    cfg, schema = _normalize_config(raw)
+    cfg, schema = _load_config(config_path, use_cache=not args.no_cache)
 
     print(f"Loaded config schema: {schema}")
 
@@ -434,7 +593,9 @@ def main() -> None:
         return
 
     if args.cmd == "generate":
-        validate_rules(cfg)
+        # Normalization does not enforce threshold ordering, so only skip on explicit request.
+        if schema == "legacy" or not args.no_validate:
+            validate_rules(cfg)
         fragments_path = Path(args.write_fragments) if getattr(args, "write_fragments", None) else None
         generate_snippets(cfg, Path(args.out), fragments_path=fragments_path)
         return